@@ -1,30 +1,57 @@
 """A Textual TUI for exploring netcdf and zarr datasets."""
 
 import argparse
+import functools
 import json
 import multiprocessing as mp
 import os
+import stat
 import time
-from collections.abc import Mapping
+import warnings
+from collections import OrderedDict, deque
+from collections.abc import Callable, Mapping
 from importlib.metadata import entry_points
+from importlib.util import find_spec
 from pathlib import Path
 from typing import Optional, Union
 from urllib.parse import urlparse
 
+import fsspec
 import numpy as np
 import xarray as xr
+from rich.text import Text
+from textual import work
 from textual.app import App, ComposeResult
 from textual.containers import Grid
 from textual.screen import Screen
 from textual.widgets import DataTable, Footer, Header, Tree
-from textual_plotext import PlotextPlot
 
 from xr_tui.hdf_reader import hdf5_to_datatree
 from xr_tui.pandas_reader import is_tabular, pandas_to_datatree
 from xr_tui.plotting import ErrorWidget, Plot1DWidget, Plot2DWidget, PlotNDWidget, TableNDWidget
+from xr_tui.statistics import (
+    APPROXIMATE_STATISTICS,
+    STATISTICS_MEMORY_BUDGET,
+    blockwise_std,
+    quartiles_and_range,
+    sampled_histogram,
+    summary_statistics,
+)
 
 mp.set_start_method("fork")
 
+# Open variables as lazy dask arrays when dask is available so that nothing is
+# read until a variable is plotted or inspected, and reductions can stream
+# chunk by chunk. Without dask, xarray's own lazy backend arrays are used.
+LAZY_CHUNKS = {} if find_spec("dask") is not None else None
+
+# Statistics and histograms already shown in the statistics screen, keyed by
+# id() of the variable. The variable is stored alongside so its id stays valid,
+# and only the most recently viewed variables are kept so that their loaded
+# data is not held for the whole session.
+STATISTICS_CACHE_SIZE = 16
+_STATISTICS_CACHE: OrderedDict[int, tuple] = OrderedDict()
+
 
 def is_remote_uri(path: str) -> bool:
     """Check if a given path is a remote URI."""
@@ -39,13 +66,111 @@ def _normalize_path(path: str) -> Union[str, Path]:
     return Path(path).resolve()
 
 
+_BYTE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+
+
+@functools.lru_cache(maxsize=4096)
 def _convert_nbytes_to_readable(nbytes: int) -> str:
     """Convert bytes to a human-readable format."""
-    for unit in ["B", "KB", "MB", "GB", "TB"]:
-        if nbytes < 1024:
-            return f"{nbytes:.2f} {unit}"
-        nbytes /= 1024
-    return f"{nbytes:.2f} PB"
+    # Each unit is 2**10 times the last, so the bit length picks it directly
+    nbytes = int(nbytes)
+    index = min(max(nbytes.bit_length() - 1, 0) // 10, len(_BYTE_UNITS) - 1)
+    return f"{nbytes / (1 << (10 * index)):.2f} {_BYTE_UNITS[index]}"
+
+
+def _is_zarr_store(path: Union[str, Path], engine: Optional[str] = None) -> bool:
+    """Check if a path should be opened with the zarr engine."""
+    if engine is not None:
+        return engine == "zarr"
+    return str(path).rstrip("/").lower().endswith(".zarr")
+
+
+def _has_consolidated_metadata(path: Union[str, Path]) -> bool:
+    """Check whether a zarr store has consolidated metadata, in either format.
+
+    zarr v2 keeps it in a .zmetadata file and zarr v3 in the root zarr.json.
+    Both candidates are requested in one batch, which remote filesystems fetch
+    concurrently, and missing files are left out of the result.
+    """
+    fs, root = fsspec.core.url_to_fs(str(path))
+    root = root.rstrip("/")
+    found = fs.cat([f"{root}/.zmetadata", f"{root}/zarr.json"], on_error="omit")
+    if any(name.endswith("/.zmetadata") for name in found):
+        return True
+    for name, content in found.items():
+        if name.endswith("/zarr.json"):
+            return json.loads(content).get("consolidated_metadata") is not None
+    return False
+
+
+def _warn(message: str) -> None:
+    warnings.warn(message, RuntimeWarning, stacklevel=3)
+
+
+def _open_zarr_datatree(
+    path: Union[str, Path], notify: Callable[[str], None] = _warn
+) -> xr.DataTree:
+    """Open a zarr store, reading all metadata in one request when consolidated.
+
+    Stores without consolidated metadata are opened array by array, and
+    notify is called with a message suggesting to consolidate them.
+    """
+    kwargs = {"chunks": LAZY_CHUNKS, "create_default_indexes": False, "engine": "zarr"}
+    if _has_consolidated_metadata(path):
+        return xr.open_datatree(path, consolidated=True, **kwargs)
+
+    notify(
+        f"No consolidated metadata found in '{path}', reading metadata for each "
+        f"array instead. Run zarr.consolidate_metadata('{path}') once to speed "
+        "up opening this store."
+    )
+    return xr.open_datatree(path, consolidated=False, **kwargs)
+
+
+def _open_single_file(
+    path: Union[str, Path], engine: Optional[str] = None, notify: Callable[[str], None] = _warn
+) -> xr.DataTree:
+    """Open a single file as a DataTree with xarray, pandas, or the HDF5 reader.
+
+    notify is called with any message for the user about how the file was opened.
+    """
+    if is_tabular(path):
+        return pandas_to_datatree(path)
+
+    if _is_zarr_store(path, engine):
+        return _open_zarr_datatree(path, notify)
+
+    try:
+        return xr.open_datatree(
+            path, chunks=LAZY_CHUNKS, create_default_indexes=False, engine=engine
+        )
+    except ValueError:
+        return hdf5_to_datatree(path)
+
+
+def _variable_nbytes(var: xr.DataArray) -> int:
+    """Return the in-memory size of a variable from its shape and dtype alone.
+
+    Unlike ``var.nbytes`` this never asks the underlying array for its size,
+    so lazy or backend arrays are never touched while building the tree.
+    """
+    return int(var.size) * var.dtype.itemsize
+
+
+def _iter_file_sizes(path: str):
+    """Yield the size of every file below a directory.
+
+    os.scandir returns the directory entries with their type already known, so
+    this avoids the extra stat per file of os.walk plus os.path.getsize, which
+    matters for zarr stores with one file per chunk.
+    """
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_file_sizes(entry.path)
+            elif entry.is_file():
+                # Symlinked files count their target's size, as os.path.getsize did
+                yield entry.stat().st_size
 
 
 def _get_file_info(file: str) -> dict:
@@ -61,23 +186,21 @@ def _get_file_info(file: str) -> dict:
             "Modified Time": "N/A (remote file)",
         }
 
-    if os.path.isdir(file):
-        file_size = sum(
-            os.path.getsize(os.path.join(dirpath, filename))
-            for dirpath, dirnames, filenames in os.walk(file)
-            for filename in filenames
-        )
+    # One stat call provides the size, permissions and timestamps
+    st = os.stat(file)
+    if stat.S_ISDIR(st.st_mode):
+        file_size = sum(_iter_file_sizes(file))
+        file_type = "Directory"
     else:
-        file_size = os.path.getsize(file)
+        file_size = st.st_size
+        file_type = os.path.splitext(file)[1].lower()
 
-    file_type = "Directory" if os.path.isdir(file) else os.path.splitext(file)[1].lower()
-    permissions = oct(os.stat(file).st_mode)[-3:]
     return {
         "File Size": _convert_nbytes_to_readable(file_size),
         "File Type": file_type,
-        "Permissions": permissions,
-        "Created Time": time.ctime(os.path.getctime(file)),
-        "Modified Time": time.ctime(os.path.getmtime(file)),
+        "Permissions": oct(st.st_mode)[-3:],
+        "Created Time": time.ctime(st.st_ctime),
+        "Modified Time": time.ctime(st.st_mtime),
     }
 
 
@@ -106,7 +229,7 @@ def _group_to_dict(group: xr.DataTree) -> dict:
         coords[name] = {
             "dims": list(var.dims),
             "dtype": str(var.dtype),
-            "size": _convert_nbytes_to_readable(var.nbytes),
+            "size": _convert_nbytes_to_readable(_variable_nbytes(var)),
             "attributes": dict(var.attrs),
         }
 
@@ -116,7 +239,7 @@ def _group_to_dict(group: xr.DataTree) -> dict:
         data_vars[name] = {
             "dims": list(var.dims),
             "dtype": str(var.dtype),
-            "size": _convert_nbytes_to_readable(var.nbytes),
+            "size": _convert_nbytes_to_readable(_variable_nbytes(var)),
             "attributes": dict(var.attrs),
         }
 
@@ -150,12 +273,14 @@ class StatisticsScreen(Screen):
             yield plot_widget
             return
 
-        stats = self._compute_statistics(self.variable)
-        data = self.variable.values.flatten()
-        data = data[~np.isnan(data)]  # Remove NaN values
+        stats, counts, edges = self._get_statistics()
+        centers = (edges[:-1] + edges[1:]) * 0.5
+
+        # pylint: disable=import-outside-toplevel
+        from textual_plotext import PlotextPlot
 
         plot_widget = PlotextPlot(id="hist-widget")
-        plot_widget.plt.hist(data, bins=self.n_bins)
+        plot_widget.plt.bar(centers.tolist(), counts.tolist(), reset_ticks=False)
         plot_widget.plt.title(f"Histogram of {self.variable.name}")
         plot_widget.plt.xlabel("Value")
         plot_widget.plt.ylabel("Frequency")
@@ -172,38 +297,136 @@ class StatisticsScreen(Screen):
         modal.border_subtitle = "[white]Press 'Esc' to return[/]"
         yield modal
 
-    def _compute_statistics(self, variable: xr.DataArray) -> dict:
-        """Compute basic statistics for the variable."""
-        data = variable.values.flatten()
-
-        nan_count = np.isnan(data).sum()
-        inf_count = np.isinf(data).sum()
-        pct_nan = (nan_count / data.size) * 100
-        pct_inf = (inf_count / data.size) * 100
-
-        data = data[~np.isnan(data)]  # Remove NaN values
+    def _get_statistics(self) -> tuple[dict, np.ndarray, np.ndarray]:
+        """Return the statistics and histogram counts/edges, computing them once per variable."""
+        key = id(self.variable)
+        cached = _STATISTICS_CACHE.get(key)
+        if cached is not None and cached[0] is self.variable:
+            _STATISTICS_CACHE.move_to_end(key)
+            return cached[1:]
+
+        if self.variable.chunks is not None and self.variable.nbytes > STATISTICS_MEMORY_BUDGET:
+            # Chunked variable too large to load - stream the reductions over its chunks
+            stats, counts, edges = self._compute_chunked_statistics(self.variable.data)
+        else:
+            # Loaded in full for exact quartiles. ravel is a view of contiguous
+            # values; for strided values it has already made the one copy
+            # needed, which can then be reordered
+            values = self.variable.values
+            data = values.ravel()
+            owns_data = not np.may_share_memory(data, values)
+            stats, valid = self._compute_statistics(data, owns_data)
+
+            # Bin in numpy rather than handing every value to plotext's Python loop,
+            # reusing the min/max as the bin range when every value is finite
+            value_range = None
+            if stats["Inf Count"] == 0:
+                value_range = (stats["Minimum"], stats["Maximum"])
+            counts, edges = sampled_histogram(valid, self.n_bins, value_range)
+
+        _STATISTICS_CACHE[key] = (self.variable, stats, counts, edges)
+        _STATISTICS_CACHE.move_to_end(key)
+        while len(_STATISTICS_CACHE) > STATISTICS_CACHE_SIZE:
+            _STATISTICS_CACHE.popitem(last=False)
+        return stats, counts, edges
+
+    def _compute_statistics(
+        self, data: np.ndarray, owns_data: bool = False
+    ) -> tuple[dict, np.ndarray]:
+        """Compute basic statistics for the flattened data.
+
+        Also returns the NaN-free values (reordered, or data itself when there
+        are no NaN values) so the histogram can reuse them without masking again.
+        With owns_data, data is a private copy that may be reordered in place.
+        """
+        if data.dtype.kind in "fc":
+            # count_nonzero has a dedicated boolean path, unlike sum's integer add
+            finite_count = np.count_nonzero(np.isfinite(data))
+        else:
+            # Integer and boolean data cannot hold NaN or Inf
+            finite_count = data.size
 
-        pct_25 = np.percentile(data, 25)
-        pct_50 = np.percentile(data, 50)
-        pct_75 = np.percentile(data, 75)
+        if finite_count == data.size:
+            # Clean data - one finite check replaces the separate NaN and Inf scans
+            nan_mask, nan_count, inf_count = None, 0, 0
+        else:
+            # Whatever isn't finite or NaN is infinite, so no separate isinf pass
+            nan_mask = np.isnan(data)
+            nan_count = np.count_nonzero(nan_mask)
+            inf_count = data.size - finite_count - nan_count
+
+        if nan_count == data.size:
+            # Nothing but NaN - every statistic is undefined
+            moments, quartiles = (np.nan,) * 4, (np.nan,) * 3
+            stats = summary_statistics(data.size, nan_count, inf_count, moments, quartiles)
+            return stats, data[:0]
+
+        # Only copy the data when there are NaN values to drop
+        valid = data[~nan_mask] if nan_count else data
+        mean = valid.mean()
+        std = blockwise_std(valid, mean)
+        quartiles, data_min, data_max = quartiles_and_range(
+            valid, in_place=owns_data or valid is not data
+        )
+        moments = (mean, std, data_min, data_max)
+        stats = summary_statistics(data.size, nan_count, inf_count, moments, quartiles)
+        return stats, valid
+
+    # pylint: disable=too-many-locals
+    def _compute_chunked_statistics(self, data) -> tuple[dict, np.ndarray, np.ndarray]:
+        """Compute statistics and histogram counts/edges for a dask array.
+
+        The reductions run on the array's own chunks, without flattening it
+        first (ravel would rechunk every block). They are computed together so
+        dask streams each chunk once per pass, keeping peak memory near one
+        chunk instead of the whole variable. Quartiles use dask's chunk-wise
+        approximate percentile, so this is only used for variables larger than
+        STATISTICS_MEMORY_BUDGET.
+        """
+        # pylint: disable=import-outside-toplevel
+        import dask
+        import dask.array as da
+
+        nan_mask = da.isnan(data)
+        inf_mask = da.isinf(data)
+        finite = da.where(nan_mask | inf_mask, np.nan, data)
+
+        with warnings.catch_warnings():
+            # All-NaN variables legitimately reduce to NaN
+            warnings.simplefilter("ignore", category=RuntimeWarning)
+            nan_count, inf_count, *moments, lo, hi = dask.compute(
+                nan_mask.sum(),
+                inf_mask.sum(),
+                da.nanmean(data),
+                da.nanstd(data),
+                da.nanmin(data),
+                da.nanmax(data),
+                da.nanmin(finite),
+                da.nanmax(finite),
+            )
 
+        if not np.isfinite(lo):
+            # No finite values to bin
+            counts, edges = np.histogram([], bins=self.n_bins)
+        else:
+            if lo == hi:
+                # Match np.histogram's handling of a constant array
+                lo, hi = lo - 0.5, hi + 0.5
+            # Values outside the range, including NaN and Inf, aren't counted
+            counts, edges = da.histogram(data, bins=self.n_bins, range=(lo, hi))
+
+        # The second pass bins the data and, unless it is all NaN, takes its quartiles
+        quartiles = (np.nan,) * 3
+        if nan_count < data.size:
+            quartiles, counts = dask.compute(da.percentile(data[~nan_mask], [25, 50, 75]), counts)
+
+        stats = summary_statistics(data.size, nan_count, inf_count, moments, quartiles)
+        # dask's percentile merges per-chunk estimates, so say so in the table
         stats = {
-            "Mean": data.mean(),
-            "Median": np.median(data),
-            "Standard Deviation": data.std(),
-            "Range": data.max() - data.min(),
-            "Minimum": data.min(),
-            "25%": pct_25,
-            "50%": pct_50,
-            "75%": pct_75,
-            "Maximum": data.max(),
-            "Count": len(data),
-            "NaN Count": nan_count,
-            "NaN %": pct_nan,
-            "Inf Count": inf_count,
-            "Inf %": pct_inf,
+            f"{name} (approx.)" if name in APPROXIMATE_STATISTICS else name: value
+            for name, value in stats.items()
         }
-        return stats
+        return stats, counts, edges
 
 
 class PlotScreen(Screen):
@@ -303,17 +526,8 @@ class XarrayTUI(App):
         """Load single file xarray or HDF5 datatree"""
         self.file = str(path)
         self.file_info = _get_file_info(self.file)
-
-        if is_tabular(path):
-            self.dataset = pandas_to_datatree(path)
-            return
-
-        try:
-            self.dataset = xr.open_datatree(
-                path, chunks=None, create_default_indexes=False, engine=self.engine
-            )
-        except ValueError:
-            self.dataset = hdf5_to_datatree(path)
+        # Opened by a worker once the app is mounted, see _open_dataset
+        self.dataset = None
 
     def _init_multi_file(self, paths: list[Path]) -> None:
         """Load multi file xarray datatree"""
@@ -363,9 +577,44 @@ class XarrayTUI(App):
 
         tree: Tree[str] = Tree(f"xarray Dataset: [bold]{self.file} [/bold]")
         tree.root.expand()
+
+        if self.dataset is None:
+            tree.root.add_leaf("[italic]Loading dataset...[/italic]")
+        else:
+            # Nodes are created already expanded via ``add(expand=True)`` rather
+            # than calling ``expand()``, which posts a NodeExpanded message per node.
+            with self.batch_update():
+                self._build_tree(tree)
+
+        yield tree
+
+    def on_mount(self) -> None:
+        """Start opening a single file dataset once the UI has been painted."""
+        if self.dataset is None:
+            self._open_dataset()
+
+    @work(thread=True, exclusive=True, group="open-dataset")
+    def _open_dataset(self) -> None:
+        """Open the dataset in a thread so that the UI does not block on slow files."""
+        dataset = _open_single_file(self.paths[0], self.engine, self._notify_from_worker)
+        self.call_from_thread(self._show_dataset, dataset)
+
+    def _notify_from_worker(self, message: str) -> None:
+        """Show a warning from a worker thread; stderr is captured while the app runs."""
+        self.call_from_thread(self.notify, message, severity="warning", timeout=10)
+
+    def _show_dataset(self, dataset: xr.DataTree) -> None:
+        """Replace the loading placeholder with the opened dataset's tree."""
+        self.dataset = dataset
+        tree = self.query_one(Tree)
+        with self.batch_update():
+            tree.root.remove_children()
+            self._build_tree(tree)
+
+    def _build_tree(self, tree: Tree) -> None:
+        """Populate the tree with file information and the dataset's groups."""
         # add file info as first child
-        file_info_node = tree.root.add("File Information")
-        file_info_node.expand()
+        file_info_node = tree.root.add("File Information", expand=True)
 
         if not hasattr(self, "file_glob"):
             self._add_leaf_items(file_info_node, self.file_info)
@@ -379,29 +628,7 @@ class XarrayTUI(App):
                 file_info_list_node = file_list_node.add(self.paths[i].name)
                 self._add_leaf_items(file_info_list_node, file)
 
-        def add_group_node(
-            parent_node: Tree, group: xr.DataTree, group_name: str = ""
-        ) -> None:
-            """Recursively add group nodes to the tree."""
-            num_vars = len(group.data_vars)
-            num_coords = len(group.coords)
-            label = f"Group: {group_name}" if group_name else "Root"
-            group_node = parent_node.add(
-                f"{label} (Data Variables: [blue]{num_vars}[/blue]"
-                f" Coordinates: [blue]{num_coords}[/blue])"
-            )
-            group_node.expand()
-
-            self._add_dims_node(group_node, group)
-            self._add_coords_node(group_node, group)
-            self._add_data_vars_node(group_node, group)
-
-            # Recursively add child groups
-            for child_name in group.children:
-                child_group = group[child_name]
-                add_group_node(group_node, child_group, child_name)
-
-        add_group_node(tree.root, self.dataset)
+        self._add_group_nodes(tree)
 
         num_attributes = len(self.dataset.attrs)
         # NOTE This is hardcoded to find the second node which should be the
@@ -411,12 +638,37 @@ class XarrayTUI(App):
         )
         self._add_attributes_node(attributes_node, self.dataset.attrs)
 
-        yield tree
+    def _add_group_nodes(self, tree: Tree) -> None:
+        """Add a node for every group in the dataset, walking it breadth-first."""
+        # Each queue entry carries the parent node to attach the group to, so the
+        # resulting layout matches a depth-first walk.
+        queue = deque([(tree.root, self.dataset, "", 0)])
+        while queue:
+            parent_node, group, group_name, depth = queue.popleft()
+            # A single view of the node's data (with inherited coordinates)
+            # serves every lookup below, rather than one per property access
+            dataset = group.dataset
+            label = f"Group: {group_name}" if group_name else "Root"
+            # Only the root group starts expanded; deeper groups are expanded
+            # on demand so that large hierarchies don't render every node.
+            group_node = parent_node.add(
+                f"{label} (Data Variables: [blue]{len(dataset.data_vars)}[/blue]"
+                f" Coordinates: [blue]{len(dataset.coords)}[/blue])",
+                expand=depth == 0,
+            )
+
+            self._add_dims_node(group_node, dataset)
+            self._add_coords_node(group_node, dataset)
+            self._add_data_vars_node(group_node, dataset)
+
+            for child_name, child_group in group.children.items():
+                queue.append((group_node, child_group, child_name, depth + 1))
 
     def _add_leaf_items(self, parent_node: Tree, iterator: dict) -> None:
         """Helper method to add dictionary items to a node's leaf."""
-        for key, value in iterator.items():
-            parent_node.add_leaf(f"[yellow]{key}[/]: {value}")
+        labels = [f"[yellow]{key}[/]: {value}" for key, value in iterator.items()]
+        for label in labels:
+            parent_node.add_leaf(label)
 
     def _add_attributes_node(self, parent_node: Tree, attributes: dict) -> None:
         """Recursively add global attributes to File Information node."""
@@ -429,36 +681,52 @@ class XarrayTUI(App):
 
     def _add_dims_node(self, parent_node: Tree, group) -> None:
         """Helper method to add dimension nodes to the tree."""
-        dims_node = parent_node.add("Dimensions")
-        dims_node.expand()
-        for dim_name, dim_size in group.dims.items():
-            dims_node.add_leaf(f"{dim_name}: [blue]{dim_size}[/blue]")
+        dims_node = parent_node.add("Dimensions", expand=True)
+        for dim_name, dim_size in group.sizes.items():
+            dims_node.add_leaf(Text.assemble(f"{dim_name}: ", (str(dim_size), "blue")))
 
     def _add_data_vars_node(self, parent_node: Tree, group) -> None:
         """Helper method to add data variable nodes to the tree."""
-        data_vars_node = parent_node.add("Data Variables")
-        data_vars_node.expand()
-        for var_name in group.data_vars.keys():
-            self._add_var_node(data_vars_node, group.data_vars[var_name])
+        data_vars_node = parent_node.add("Data Variables", expand=True)
+        for var in group.data_vars.values():
+            self._add_var_node(data_vars_node, var)
 
     def _add_coords_node(self, parent_node: Tree, group) -> None:
         """Helper method to add coordinate nodes to the tree."""
-        coords_node = parent_node.add("Coordinates")
-        coords_node.expand()
-        for coord_name in group.coords.keys():
-            self._add_var_node(coords_node, group.coords[coord_name])
+        coords_node = parent_node.add("Coordinates", expand=True)
+        for coord in group.coords.values():
+            self._add_var_node(coords_node, coord)
 
     def _add_var_node(self, parent_node: Tree, var: xr.DataArray) -> None:
         """Helper method to add a variable node to the tree."""
-        nbytes = _convert_nbytes_to_readable(var.nbytes)
+        # Labels are assembled as styled Text, as parsing markup for each of
+        # the many variable nodes dominates the cost of building the tree
+        nbytes = _convert_nbytes_to_readable(_variable_nbytes(var))
         var_node = parent_node.add(
-            f"{var.name}: [red]{var.dims}[/] [green]{var.dtype}[/] [blue]{nbytes}[/]",
+            Text.assemble(
+                f"{var.name}: ",
+                (str(var.dims), "red"),
+                " ",
+                (str(var.dtype), "green"),
+                " ",
+                (nbytes, "blue"),
+            )
         )
         var_node.data = {"name": var.name, "type": "variable_node", "item": var}
 
+        # The attribute leaves are only created when the node is first expanded
         num_attributes = len(var.attrs)
-        attr_node = var_node.add(f"Attributes ([blue]{num_attributes}[/blue])")
-        self._add_leaf_items(attr_node, var.attrs)
+        attr_node = var_node.add(Text.assemble("Attributes (", (str(num_attributes), "blue"), ")"))
+        attr_node.data = {"name": var.name, "type": "attributes_node", "item": var}
+
+    def on_tree_node_expanded(self, event: Tree.NodeExpanded) -> None:
+        """Populate a variable's attributes node the first time it is expanded."""
+        node = event.node
+        if node.data is None or node.data.get("type") != "attributes_node":
+            return
+        if not node.children:
+            with self.batch_update():
+                self._add_leaf_items(node, node.data["item"].attrs)
 
     def action_plot_variable(self) -> None:
         """An action to plot the currently selected variable."""
@@ -584,15 +852,7 @@ def main():
 
         if len(paths) == 1:
             file_info = {"file_info": _get_file_info(str(paths[0]))}
-            if is_tabular(paths[0]):
-                dataset = pandas_to_datatree(paths[0])
-            else:
-                try:
-                    dataset = xr.open_datatree(
-                        paths[0], chunks=None, create_default_indexes=False, engine=args.engine
-                    )
-                except ValueError:
-                    dataset = hdf5_to_datatree(paths[0])
+            dataset = _open_single_file(paths[0], args.engine)
         else:
             parent_dirs = list({p.parent for p in paths})
             file_suffixes = list({p.suffix for p in paths})
@@ -618,6 +878,7 @@ def main():
             dataset = plugin.load().open_mfdatatree(None, paths)
 
         output = {**file_info, "dataset": _group_to_dict(dataset)}
+        dataset.close()
         json_str = json.dumps(output, indent=2, cls=_NumpyEncoder)
 
         if args.export_json is True:
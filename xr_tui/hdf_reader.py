@@ -3,6 +3,31 @@
 import h5py
 import numpy as np
 import xarray as xr
+from xarray.backends import BackendArray
+from xarray.core import indexing
+
+
+# pylint: disable=abstract-method
+class H5DatasetArray(BackendArray):
+    """An h5py dataset that xarray reads lazily, one requested slice at a time."""
+
+    def __init__(self, file, dataset):
+        # The file is kept so it is not closed while the dataset is still in use
+        self.file = file
+        self.dataset = dataset
+        self.shape = dataset.shape
+        self.dtype = dataset.dtype
+
+    def __getitem__(self, key):
+        # h5py only handles increasing fancy indices, so let xarray read basic
+        # slices and apply anything more complex in memory
+        return indexing.explicit_indexing_adapter(
+            key, self.shape, indexing.IndexingSupport.BASIC, self._getitem
+        )
+
+    def _getitem(self, key):
+        # Reuse the open dataset rather than looking its path up on every read
+        return np.asarray(self.dataset[key])
 
 
 def resolve_reference(file, ref):
@@ -13,45 +38,84 @@ def resolve_reference(file, ref):
     if isinstance(obj, h5py.Dataset):
         return obj[()]  # return array
 
+    # Group reference → shape and dtype of its members, as reading every
+    # member dataset behind a single reference could be far larger than the
+    # referencing dataset itself
     if isinstance(obj, h5py.Group):
         return {
-            k: v[()] if isinstance(v, h5py.Dataset) else "group" for k, v in obj.items()
+            k: (v.shape, v.dtype) if isinstance(v, h5py.Dataset) else "group"
+            for k, v in obj.items()
         }
 
     return None
 
 
+def _cached_resolver(file):
+    """Return a resolve_reference for file that reads each distinct target only once.
+
+    Reference arrays often point many times at a handful of lookup tables.
+    h5py references hash by identity, so the cache is keyed on the path of
+    the referenced object instead.
+    """
+    cache = {}
+
+    def resolve(ref):
+        key = h5py.h5r.get_name(ref, file.id)  # pylint: disable=c-extension-no-member
+        if key not in cache:
+            cache[key] = resolve_reference(file, ref)
+        return cache[key]
+
+    return resolve
+
+
 def resolve_region_reference(dataset, regref):
     """Return the sliced region referenced in a region reference."""
     return dataset[regref]  # h5py handles slicing internally
 
 
+def _resolve_each(arr, resolve):
+    """Apply resolve to every element of arr, returning an object array of the same shape.
+
+    The elements are visited in C order through flat views rather than with
+    np.ndenumerate, which builds an index tuple per element.
+    """
+    out = np.empty(arr.shape, dtype=object)
+    flat_out = out.reshape(-1)
+    for i, ref in enumerate(arr.reshape(-1)):
+        flat_out[i] = resolve(ref)
+    return out
+
+
 def load_dataset_with_refs(file, dataset):
     """Load HDF5 dataset, resolving any object/region references."""
-    arr = dataset[()]  # read raw data
+    # The reference kind is part of the dtype metadata, so plain datasets are
+    # recognised without reading or probing any of their elements
+    ref_type = h5py.check_dtype(ref=dataset.dtype)
+    if ref_type is None:
+        return dataset[()]  # normal dataset
+
+    arr = dataset[()]  # read raw references
+
+    # Region references (rare but possible) select from the dataset they point to
+    if ref_type is h5py.RegionReference:
+        return _resolve_each(arr, lambda regref: resolve_region_reference(file[regref], regref))
+
+    # Convert array of references → Python objects
+    return _resolve_each(arr, _cached_resolver(file))
 
-    if dataset.dtype == h5py.ref_dtype:
-        # Convert array of references → Python objects
-        out = np.empty(arr.shape, dtype=object)
-        for idx, ref in np.ndenumerate(arr):
-            out[idx] = resolve_reference(file, ref)
-        return out
 
-    if dataset.dtype.kind == "O" and isinstance(arr.flat[0], h5py.Reference):
-        # Sometimes references appear as object dtype
-        out = np.empty(arr.shape, dtype=object)
-        for idx, ref in np.ndenumerate(arr):
-            out[idx] = resolve_reference(file, ref)
-        return out
+def load_dataset_lazily(file, dataset):
+    """Wrap a plain numeric dataset for lazy reading, or load it with its references.
 
-    # Region references (rare but possible)
-    if dataset.dtype == h5py.regionref_dtype:
-        out = np.empty(arr.shape, dtype=object)
-        for idx, regref in np.ndenumerate(arr):
-            out[idx] = resolve_region_reference(dataset, regref)
-        return out
+    Only metadata is read for lazily wrapped datasets, so building the tree
+    costs the same however large the file is.
+    """
+    is_plain = h5py.check_dtype(ref=dataset.dtype) is None and dataset.dtype.kind in "biufc"
+    if not is_plain or dataset.ndim == 0:
+        return load_dataset_with_refs(file, dataset)
 
-    return arr  # normal dataset
+    array = H5DatasetArray(file, dataset)
+    return indexing.LazilyIndexedArray(array)
 
 
 def infer_dims(name, arr):
@@ -63,15 +127,18 @@ def hdf5_group_to_datatree(name, group, file):
     """Recursively convert a group, resolving references."""
     variables = {}
     coords = {}
+    child_groups = {}
 
-    # Load datasets
+    # Visit the members once; each lookup opens an HDF5 object
     for key, item in group.items():
-        if isinstance(item, h5py.Dataset):
-            data = load_dataset_with_refs(file, item)
-            dims = infer_dims(key, data)
+        if isinstance(item, h5py.Group):
+            child_groups[key] = item
+        elif isinstance(item, h5py.Dataset):
+            data = load_dataset_lazily(file, item)
+            dims = infer_dims(key, item)
             variables[key] = (dims, data)
 
-            if np.ndim(data) == 1:
+            if item.ndim == 1:
                 coords[key] = (dims, data)
 
     ds = xr.Dataset(variables)
@@ -80,9 +147,7 @@ def hdf5_group_to_datatree(name, group, file):
 
     # Load children groups
     children = {
-        key: hdf5_group_to_datatree(key, item, file)
-        for key, item in group.items()
-        if isinstance(item, h5py.Group)
+        key: hdf5_group_to_datatree(key, item, file) for key, item in child_groups.items()
     }
 
     return xr.DataTree(
@@ -92,13 +157,19 @@ def hdf5_group_to_datatree(name, group, file):
 
 def hdf5_to_datatree(path, group: str = None) -> xr.DataTree:
     """Read HDF5 file into a hierarchical DataTree with reference resolution."""
-    with h5py.File(path, "r") as f:
+    # The file stays open for the tree's lazy arrays until the tree is closed
+    f = h5py.File(path, "r")
+    try:
         tree = hdf5_group_to_datatree("root", f, f)
 
-    if group:
-        try:
-            return tree[group]
-        except KeyError as exc:
-            raise ValueError(f"Group '{group}' not found in the HDF5 file.") from exc
+        if group:
+            try:
+                tree = tree[group]
+            except KeyError as exc:
+                raise ValueError(f"Group '{group}' not found in the HDF5 file.") from exc
+    except BaseException:
+        f.close()
+        raise
 
+    tree.set_close(f.close)
     return tree
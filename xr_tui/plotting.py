@@ -1,21 +1,263 @@
 """Widgets for plotting xarray DataArray variables."""
 
+import threading
+import warnings
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
 import numpy as np
 import xarray as xr
-from textual import on
+from textual import on, work
 from textual.app import ComposeResult
 from textual.containers import Horizontal, Vertical
+from textual.timer import Timer
 from textual.widget import Widget
 from textual.widgets import DataTable, RadioButton, RadioSet, Static
-from textual_plotext import PlotextPlot
+from textual.worker import get_current_worker
 from textual_slider import Slider
 
+if TYPE_CHECKING:
+    from textual_plotext import PlotextPlot
+
 
 def format_coord_value(val) -> str:
     """Format a coordinate value as string, with 4 decimal places for numeric values."""
     return f"{val:.4f}" if isinstance(val, (int, float, np.number)) else str(val)
 
 
+MAX_PLOT_ROWS = 80
+MAX_PLOT_COLS = 200
+MAX_PLOT_TICKS = 10
+# Arrays at or below this size are plotted as-is; above BLOCK_MEAN_MIN_SIZE,
+# cells are averaged rather than picked so that sparse features survive.
+DOWNSAMPLE_MIN_SIZE = 10_000
+BLOCK_MEAN_MIN_SIZE = 1_000_000
+# Slider changes closer together than this are coalesced into one redraw
+SLIDER_DEBOUNCE_SECONDS = 0.03
+
+
+def _tick_subsample(coords: np.ndarray, max_ticks: int = MAX_PLOT_TICKS) -> tuple[list, list]:
+    """Return evenly spaced tick positions and formatted labels for an axis.
+
+    Only the labels that are actually drawn are formatted, rather than one
+    per coordinate value. Numeric labels are formatted in a single NumPy call,
+    matching format_coord_value.
+    """
+    step = max(1, -(-len(coords) // max_ticks))
+    positions = list(range(0, len(coords), step))
+    coords = np.asarray(coords)
+    if coords.dtype.kind in "iuf":
+        return positions, np.char.mod("%.4f", coords[::step]).tolist()
+    return positions, [format_coord_value(coords[i]) for i in positions]
+
+
+def _downsample_2d(
+    z: np.ndarray,
+    x_coords: np.ndarray,
+    y_coords: np.ndarray,
+    max_rows: int = MAX_PLOT_ROWS,
+    max_cols: int = MAX_PLOT_COLS,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Reduce a 2D array and its coordinates to at most max_rows x max_cols.
+
+    plotext can only draw one value per terminal cell, so anything beyond the
+    screen resolution is wasted work when converting to Python lists. Large
+    arrays whose shape divides evenly into blocks are block-averaged; all
+    others are strided.
+    """
+    if z.size <= DOWNSAMPLE_MIN_SIZE:
+        return z, x_coords, y_coords
+
+    sy = max(1, -(-z.shape[0] // max_rows))
+    sx = max(1, -(-z.shape[1] // max_cols))
+    if sy == sx == 1:
+        return z, x_coords, y_coords
+
+    ny, rem_y = divmod(z.shape[0], sy)
+    nx, rem_x = divmod(z.shape[1], sx)
+    if z.size > BLOCK_MEAN_MIN_SIZE and rem_y == rem_x == 0 and z.dtype.kind in "fiub":
+        blocks = z.reshape(ny, sy, nx, sx)
+        # nanmean copies the whole array to mask out NaNs, so it is only used
+        # when the minimum, which propagates NaN, shows that there are any
+        if z.dtype.kind == "f" and np.isnan(z.min()):
+            # Blocks that are entirely NaN stay NaN; silence the warning for them
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", category=RuntimeWarning)
+                z = np.nanmean(blocks, axis=(1, 3))
+        else:
+            z = blocks.mean(axis=(1, 3))
+        return z, x_coords[::sx], y_coords[::sy]
+
+    return z[::sy, ::sx], x_coords[::sx], y_coords[::sy]
+
+
+def _downsample_1d(
+    x_coords: np.ndarray, y_values: np.ndarray, max_points: int = 4 * MAX_PLOT_COLS
+) -> tuple[np.ndarray, np.ndarray]:
+    """Reduce a line to at most max_points points, keeping its peaks.
+
+    The values are split into buckets and the minimum and maximum of each are
+    kept in order, so that spikes narrower than a bucket are still drawn.
+    Non-numeric values are strided instead.
+    """
+    n = len(y_values)
+    if n <= max_points:
+        return x_coords, y_values
+
+    bucket = -(-n // (max_points // 2))
+    if y_values.dtype.kind not in "fiub":
+        return x_coords[::bucket], y_values[::bucket]
+
+    n_full = n - n % bucket
+    blocks = y_values[:n_full].reshape(-1, bucket)
+    offsets = np.arange(0, n_full, bucket)
+    picks = [offsets + blocks.argmin(axis=1), offsets + blocks.argmax(axis=1)]
+    if n_full < n:
+        tail = y_values[n_full:]
+        picks.append(np.array([n_full + tail.argmin(), n_full + tail.argmax()]))
+    index = np.unique(np.concatenate(picks))
+    return x_coords[index], y_values[index]
+
+
+def _new_plot(widget_id: str) -> "PlotextPlot":
+    """Create a plot widget, importing plotext only once a plot is first shown."""
+    # pylint: disable=import-outside-toplevel
+    from textual_plotext import PlotextPlot
+
+    return PlotextPlot(id=widget_id)
+
+
+def _plot_resolution(plot_widget: "PlotextPlot") -> tuple[int, int]:
+    """Return the rows and columns a plot widget can draw, within the plot limits.
+
+    Before the widget has been laid out its size is zero, so the limits are used.
+    """
+    height, width = plot_widget.size.height, plot_widget.size.width
+    if not height or not width:
+        return MAX_PLOT_ROWS, MAX_PLOT_COLS
+    return min(height, MAX_PLOT_ROWS), min(width, MAX_PLOT_COLS)
+
+
+def _stride_lazily(
+    variable: xr.DataArray, max_rows: int = MAX_PLOT_ROWS, max_cols: int = MAX_PLOT_COLS
+) -> tuple[xr.DataArray, int, int]:
+    """Stride a chunked 2D variable down to the plot resolution before it is computed.
+
+    Calling .values on a dask-backed variable computes every element, so the
+    stride is applied lazily first and only the cells that are drawn are loaded.
+    In-memory variables are left whole so they can be block-averaged. Returns
+    the variable with its row and column strides.
+    """
+    if variable.chunks is None:
+        return variable, 1, 1
+    sy = max(1, -(-variable.shape[0] // max_rows))
+    sx = max(1, -(-variable.shape[1] // max_cols))
+    strided = variable.isel(
+        {variable.dims[0]: slice(None, None, sy), variable.dims[1]: slice(None, None, sx)}
+    )
+    return strided, sy, sx
+
+
+def _fill_non_finite(values: np.ndarray, in_place: bool = False) -> np.ndarray:
+    """Replace NaN with 0 and infinities with finite values, as np.nan_to_num.
+
+    The input is returned as-is when all values are already finite, avoiding a
+    full-size copy for clean data. Only pass in_place for arrays the caller
+    owns; others may share memory with the dataset or the slice cache.
+    """
+    if values.dtype.kind not in "fc" or np.isfinite(values).all():
+        return values
+    if in_place:
+        return np.nan_to_num(values, nan=0.0, copy=False)
+    return np.nan_to_num(values, nan=0.0)
+
+
+def _fill_downsampled(z: np.ndarray, loaded: np.ndarray) -> np.ndarray:
+    """Fill the non-finite values of z, a downsampled copy or view of loaded.
+
+    Block-averaging returns a new array, which is filled in place; strided
+    views and unreduced arrays still reference the loaded data and are copied.
+    """
+    return _fill_non_finite(z, in_place=not np.may_share_memory(z, loaded))
+
+
+_GRAY_LEVELS = [(level, level, level) for level in range(256)]
+
+
+def _to_grayscale(z: np.ndarray) -> list:
+    """Convert a 2D array to the nested list of RGB triples matrix_plot draws.
+
+    plotext only accepts nested lists and would otherwise scale every value to
+    a gray level in Python. Doing the scaling in NumPy, with the same rounding,
+    leaves it only the lookup of one shared triple per cell.
+    """
+    if not z.size or (lo := z.min()) == (hi := z.max()):
+        return [[_GRAY_LEVELS[127]] * z.shape[1] for _ in range(z.shape[0])]
+    # A single float64 buffer is scaled in place rather than allocating a
+    # temporary per operation; the order of operations matches plotext
+    scaled = np.subtract(z, lo, dtype=np.float64)
+    scaled *= 255
+    scaled /= float(hi) - float(lo)
+    levels = scaled.astype(np.intp)
+    return [[_GRAY_LEVELS[level] for level in row] for row in levels.tolist()]
+
+
+class SliceCache:
+    """An LRU cache of materialised 2D slices, bounded by entry count and bytes.
+
+    Slices are keyed by the identity of the variable they came from and the
+    indices of the sliced dimensions. The cache holds a reference to each
+    variable so that its id cannot be reused while an entry is alive. Access
+    is guarded by a lock because slices are prefetched from worker threads.
+    """
+
+    def __init__(self, max_entries: int = 100, max_bytes: int = 256 * 1024**2) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(variable: xr.DataArray, slice_dict: dict) -> tuple:
+        """Return the cache key for a slice of the variable."""
+        return id(variable), tuple(sorted(slice_dict.items()))
+
+    def __contains__(self, key: tuple) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def get(self, key: tuple):
+        """Return the cached slice for key, or None if it is not cached."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, key: tuple, variable: xr.DataArray, values: np.ndarray) -> None:
+        """Cache a slice, evicting the least recently used entries as needed.
+
+        The array is marked read-only so that callers cannot modify a cached
+        slice in place.
+        """
+        if values.nbytes > self.max_bytes:
+            return
+        values.flags.writeable = False
+        with self._lock:
+            if key in self._entries:
+                self._nbytes -= self._entries.pop(key)[1].nbytes
+            self._entries[key] = (variable, values)
+            self._nbytes += values.nbytes
+            while len(self._entries) > self.max_entries or self._nbytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._nbytes -= evicted.nbytes
+
+
+SLICE_CACHE = SliceCache()
+
+
 class ErrorWidget(Widget):
     """A widget to display plot errors."""
 
@@ -51,9 +293,10 @@ class Plot1DWidget(Widget):
             x_coords = np.arange(self.variable.shape[0])
 
         y_values = self.variable.values
-        y_values = np.nan_to_num(y_values, nan=0.0)
+        y_values = _fill_non_finite(y_values)
+        x_coords, y_values = _downsample_1d(x_coords, y_values)
 
-        plot_widget = PlotextPlot(id="plot-container")
+        plot_widget = _new_plot("plot-container")
         plot_widget.plt.plot(x_coords.tolist(), y_values.tolist())
         xunit = self.variable.coords[x_dim_name].attrs.get("units", "")
         xlabel = f"{x_dim_name} ({xunit})" if xunit else x_dim_name
@@ -70,32 +313,36 @@ class Plot2DWidget(Widget):
         super().__init__(**kwargs)
         self.variable = variable
 
+    # pylint: disable=too-many-locals
     def compose(self) -> ComposeResult:
         """Render the 2D plot."""
         x_dim_name = self.variable.dims[1]
         y_dim_name = self.variable.dims[0]
 
-        z = self.variable.values
-        z = np.nan_to_num(z, nan=0.0)
+        variable, sy, sx = _stride_lazily(self.variable)
+        z = loaded = variable.values
 
         # Get coordinate values
-        if x_dim_name in self.variable.coords:
-            x_coords = self.variable.coords[x_dim_name].values
+        if x_dim_name in variable.coords:
+            x_coords = variable.coords[x_dim_name].values
         else:
-            x_coords = np.arange(z.shape[1])
+            x_coords = np.arange(0, self.variable.shape[1], sx)
 
-        if y_dim_name in self.variable.coords:
-            y_coords = self.variable.coords[y_dim_name].values
+        if y_dim_name in variable.coords:
+            y_coords = variable.coords[y_dim_name].values
         else:
-            y_coords = np.arange(z.shape[0])
+            y_coords = np.arange(0, self.variable.shape[0], sy)
+
+        z, x_coords, y_coords = _downsample_2d(z, x_coords, y_coords)
+        z = _fill_downsampled(z, loaded)
 
-        x_ticks = [format_coord_value(val) for val in x_coords]
-        y_ticks = [format_coord_value(val) for val in y_coords]
+        x_ticks, x_labels = _tick_subsample(x_coords)
+        y_ticks, y_labels = _tick_subsample(y_coords)
 
-        plot_widget = PlotextPlot(id="plot-container")
-        plot_widget.plt.matrix_plot(z.tolist())
-        plot_widget.plt.xticks(np.arange(len(x_coords)), labels=x_ticks)
-        plot_widget.plt.yticks(np.arange(len(y_coords)), labels=y_ticks)
+        plot_widget = _new_plot("plot-container")
+        plot_widget.plt.matrix_plot(_to_grayscale(z))
+        plot_widget.plt.xticks(x_ticks, labels=x_labels)
+        plot_widget.plt.yticks(y_ticks, labels=y_labels)
 
         xunit = self.variable.coords[x_dim_name].attrs.get("units", "")
         yunit = self.variable.coords[y_dim_name].attrs.get("units", "")
@@ -110,16 +357,32 @@ class Plot2DWidget(Widget):
         yield plot_widget
 
 
-class PlotNDWidget(Widget):
+class PlotNDWidget(Widget):  # pylint: disable=too-many-instance-attributes
     """A widget to plot ND variables."""
 
     def __init__(self, variable: xr.DataArray, **kwargs) -> None:
         super().__init__(**kwargs)
         self.variable = variable
+        # Plain copies of the variable's metadata, read on every slider change
+        self._dims = list(variable.dims)
+        self._sizes = dict(variable.sizes)
+        self._name = variable.name
+        # Axis coordinates and tick labels do not depend on the slider
+        # positions, so they are computed once per pair of plotted dims
+        self._coord_cache: dict[tuple[int, int], tuple] = {}
+        self._tick_cache: dict[tuple[int, int, int, int], tuple] = {}
+        self._default_slices: dict[tuple[int, int], dict[str, int]] = {}
+        # The dimension radio sets, kept from compose to skip a query per event
+        self._dim1_group: RadioSet | None = None
+        self._dim2_group: RadioSet | None = None
+        self._redraw_timer: Timer | None = None
+        # Widgets kept from compose, so events do not query the DOM for them
+        self._sliders: list[Slider] = []
+        self._plot_widget: PlotextPlot | None = None
 
     def compose(self) -> ComposeResult:
         """Create child widgets for the screen."""
-        dims = list(self.variable.dims)
+        dims = self._dims
 
         dim1 = 0
         dim2 = 1
@@ -140,6 +403,7 @@ class PlotNDWidget(Widget):
         r1.border_title = "[white]Y Dimension[/]"
         r2 = RadioSet(*r2_buttons, id="y-dim-select-2")
         r2.border_title = "[white]X Dimension[/]"
+        self._dim1_group, self._dim2_group = r1, r2
 
         slice_inputs = self.create_slice_sliders(dim1, dim2)
 
@@ -153,152 +417,252 @@ class PlotNDWidget(Widget):
 
         yield plot_widget
 
-    def create_slice_sliders(self, dim1: int = 0, dim2: int = 1) -> None:
-        """Create sliders for slicing dimensions other than dim1 and dim2."""
+    def create_slice_sliders(self, dim1: int = 0, dim2: int = 1) -> Horizontal:
+        """Create a slider for every dimension, showing those other than dim1 and dim2.
+
+        Sliders for the plotted dimensions are hidden rather than omitted so
+        that changing the plotted dimensions only toggles their visibility.
+        """
         slice_inputs = []
-        dims = list(self.variable.dims)
+        dims = self._dims
         for dim in dims:
-            if dim not in [dims[dim1], dims[dim2]]:
-                dim_size = self.variable.sizes[dim]
-                slider = Slider(
-                    0,
-                    dim_size - 1,
-                    step=1,
-                    id=f"slice-{dim}",
-                    name=dim,
-                    value=dim_size // 2,
-                )
-                slider.border_title = f"[white]Slice Position for {dim}[/]"
-                slice_inputs.append(slider)
+            dim_size = self._sizes[dim]
+            slider = Slider(
+                0,
+                dim_size - 1,
+                step=1,
+                id=f"slice-{dim}",
+                name=dim,
+                value=dim_size // 2,
+            )
+            slider.border_title = f"[white]Slice Position for {dim}[/]"
+            slider.display = dim not in [dims[dim1], dims[dim2]]
+            slice_inputs.append(slider)
 
+        self._sliders = slice_inputs
         slice_inputs = Horizontal(*slice_inputs, id="slice-inputs-container")
         return slice_inputs
 
+    def _get_slice_positions(self) -> dict:
+        """Return the current position of every slice slider."""
+        return {slicer.name: slicer.value for slicer in self._sliders}
+
     @on(Slider.Changed)
     async def on_slider_changed_normal(self, _event: Slider.Changed) -> None:
-        """Handle slider change events to update the plot."""
-        slicers = self.query_one("#slice-inputs-container")
-        slicers = slicers.children
-        slice_positions = {
-            slicer.name: slicer.value
-            for slicer in slicers
-            if isinstance(slicer, Slider)
-        }
-
-        dim1_group = self.query_one("#x-dim-select-1")
-        dim2_group = self.query_one("#y-dim-select-2")
+        """Handle slider change events to update the plot.
 
-        dim1 = self._get_selected_dim(dim1_group)
-        dim2 = self._get_selected_dim(dim2_group)
+        Dragging a slider sends a burst of changes, so the redraw is deferred
+        until the slider has been still for SLIDER_DEBOUNCE_SECONDS.
+        """
+        if self._redraw_timer is not None:
+            self._redraw_timer.stop()
+        self._redraw_timer = self.set_timer(SLIDER_DEBOUNCE_SECONDS, self._redraw_for_sliders)
+
+    def _redraw_for_sliders(self) -> None:
+        """Redraw the plot at the current slider positions and prefetch around them."""
+        self._redraw_timer = None
+        slice_positions = self._get_slice_positions()
+
+        dim1 = self._get_selected_dim(self._dim1_group)
+        dim2 = self._get_selected_dim(self._dim2_group)
 
-        new_plot = self._plot_variable_nd(dim1, dim2, slice_positions)
-        plot_container = self.query_one("#plot-container")
+        self._redraw_plot(dim1, dim2, slice_positions)
+        self._prefetch_slices(dim1, dim2, slice_positions)
 
-        # Swap out the old plot with the new one
-        await plot_container.children[-1].remove()
-        await plot_container.mount(new_plot)
+    @work(thread=True, exclusive=True, group="prefetch-slices")
+    def _prefetch_slices(
+        self, dim1: int, dim2: int, slice_positions: dict, radius: int = 2
+    ) -> None:
+        """Read the slices either side of the current position into the cache.
+
+        Runs in a worker thread so that scrubbing a slider finds the next
+        positions already loaded. Starting a new prefetch cancels the last one.
+        """
+        worker = get_current_worker()
+        current = self._get_slice_dict(dim1, dim2, slice_positions)
+        for dim, position in current.items():
+            for offset in range(1, radius + 1):
+                for neighbour in (position + offset, position - offset):
+                    if worker.is_cancelled:
+                        return
+                    if not 0 <= neighbour < self._sizes[dim]:
+                        continue
+                    slice_dict = {**current, dim: neighbour}
+                    if SLICE_CACHE.make_key(self.variable, slice_dict) not in SLICE_CACHE:
+                        self._load_slice(slice_dict)
 
     def _get_selected_dim(self, radio_set: RadioSet) -> int:
-        for i, radio in enumerate(radio_set.children):
-            if isinstance(radio, RadioButton) and radio.value:
-                return i
-        return 0
+        index = radio_set.pressed_index
+        if index >= 0:
+            return index
+        # The pressed button is only tracked once the set has mounted
+        return next(
+            (
+                i
+                for i, radio in enumerate(radio_set.children)
+                if isinstance(radio, RadioButton) and radio.value
+            ),
+            0,
+        )
 
     async def on_radio_set_changed(self, _message: RadioSet.Changed):
         """Handle radio button changes to update the plot."""
-        dim1_group = self.query_one("#x-dim-select-1")
-        dim2_group = self.query_one("#y-dim-select-2")
+        dim1_group, dim2_group = self._dim1_group, self._dim2_group
 
         dim1 = self._get_selected_dim(dim1_group)
         dim2 = self._get_selected_dim(dim2_group)
 
-        for i, radio in enumerate(dim1_group.children):
-            if isinstance(radio, RadioButton):
-                radio.disabled = i == dim2
-
-        for i, radio in enumerate(dim2_group.children):
-            if isinstance(radio, RadioButton):
-                radio.disabled = i == dim1
+        # Each radio set is walked once; a button is disabled when its
+        # dimension is selected in the other set
+        for radios, other in ((list(dim1_group.children), dim2), (list(dim2_group.children), dim1)):
+            for i, radio in enumerate(radios):
+                if isinstance(radio, RadioButton):
+                    radio.disabled = i == other
 
         dim1_group.refresh()
         dim2_group.refresh()
 
-        slice_inputs = self.create_slice_sliders(dim1, dim2)
-
-        # Re-plot with new dimensions
-        new_plot = self._plot_variable_nd(dim1, dim2)
-        plot_container = self.query_one("#plot-container")
-        await plot_container.children[-1].remove()
-        await plot_container.children[-1].remove()
-        await plot_container.mount(slice_inputs)
-        await plot_container.mount(new_plot)
+        # Show the sliders for the newly sliced dimensions only
+        plot_dims = (self._dims[dim1], self._dims[dim2])
+        for slider in self._sliders:
+            slider.display = slider.name not in plot_dims
+
+        self._redraw_plot(dim1, dim2, self._get_slice_positions())
+
+    def _get_slice_dict(self, dim1: int, dim2: int, slice_positions: dict) -> dict:
+        """Return the index of every dimension other than dim1 and dim2.
+
+        Dimensions without a slider position default to their middle slice.
+        """
+        defaults = self._default_slices.get((dim1, dim2))
+        if defaults is None:
+            plot_dims = (self._dims[dim1], self._dims[dim2])
+            defaults = {dim: self._sizes[dim] // 2 for dim in self._dims if dim not in plot_dims}
+            self._default_slices[(dim1, dim2)] = defaults
+        return {dim: int(slice_positions.get(dim, middle)) for dim, middle in defaults.items()}
+
+    def _load_slice(self, slice_dict: dict) -> np.ndarray:
+        """Return the values of a slice, indexing the variable only on a cache miss.
+
+        The values keep the variable's dimension order.
+        """
+        key = SLICE_CACHE.make_key(self.variable, slice_dict)
+        values = SLICE_CACHE.get(key)
+        if values is None:
+            values = np.asarray(self.variable.isel(slice_dict).values)
+            SLICE_CACHE.put(key, self.variable, values)
+        return values
+
+    def _axis_coords(self, dim1: int, dim2: int) -> tuple:
+        """Return the coordinates and axis label of dim1 and of dim2."""
+        key = (dim1, dim2)
+        if key not in self._coord_cache:
+            axes = []
+            for dim in (self._dims[dim1], self._dims[dim2]):
+                if dim in self.variable.coords:
+                    coord = self.variable.coords[dim]
+                    values, unit = coord.values, coord.attrs.get("units", "")
+                else:
+                    values, unit = np.arange(self._sizes[dim]), ""
+                axes.append((values, f"{dim} ({unit})" if unit else dim))
+            self._coord_cache[key] = tuple(axes)
+        return self._coord_cache[key]
+
+    def _axis_ticks(
+        self, key: tuple[int, int, int, int], x_coords: np.ndarray, y_coords: np.ndarray
+    ) -> tuple:
+        """Return the x and y tick positions and labels for a downsampled plot.
+
+        The downsampled coordinates are fixed by the plotted dims and the
+        plot resolution, which together make up the key.
+        """
+        if key not in self._tick_cache:
+            self._tick_cache[key] = (*_tick_subsample(x_coords), *_tick_subsample(y_coords))
+        return self._tick_cache[key]
 
-    # pylint: disable=too-many-locals
     def _plot_variable_nd(
         self, dim1: int = 0, dim2: int = 1, slice_positions: dict = None
-    ) -> PlotextPlot:
-        if slice_positions is None:
-            slice_positions = {}
-
-        # Default to last two dimensions for x and y
-        y_dim_name = self.variable.dims[dim1]
-        x_dim_name = self.variable.dims[dim2]
+    ) -> "PlotextPlot":
+        plot_widget = self._plot_widget = _new_plot("plot-widget")
+        self._draw_plot(plot_widget, dim1, dim2, slice_positions)
+        return plot_widget
 
-        # Get the indices for other dimensions (set to middle slice)
-        slice_dict = {}
-        for dim in self.variable.dims:
-            if dim not in [x_dim_name, y_dim_name]:
-                if dim in slice_positions:
-                    slice_dict[dim] = slice_positions[dim]
-                else:
-                    dim_size = self.variable.sizes[dim]
-                    slice_dict[dim] = dim_size // 2
+    def _redraw_plot(self, dim1: int, dim2: int, slice_positions: dict) -> None:
+        """Redraw the existing plot widget rather than mounting a new one."""
+        max_rows, max_cols = _plot_resolution(self._plot_widget)
+        self._compute_plot(dim1, dim2, slice_positions, max_rows, max_cols)
 
-        # Slice the variable to get 2D data
-        sliced_var = self.variable.isel(slice_dict)
+    @work(thread=True, exclusive=True, group="draw-plot")
+    def _compute_plot(
+        self, dim1: int, dim2: int, slice_positions: dict, max_rows: int, max_cols: int
+    ) -> None:
+        """Prepare a redraw in a worker thread and apply it on the UI thread.
+
+        Loading, downsampling and scaling a large slice would otherwise stall
+        the UI while a slider is dragged; NumPy releases the GIL for most of
+        it. Starting a new redraw cancels one that has not finished.
+        """
+        plot = self._plot_data(dim1, dim2, slice_positions, max_rows, max_cols)
+        if not get_current_worker().is_cancelled:
+            self.app.call_from_thread(self._apply_plot, plot)
+
+    def _apply_plot(self, plot: tuple) -> None:
+        """Replace the contents of the plot widget with prepared plot data."""
+        plot_widget = self._plot_widget
+        plot_widget.plt.clear_figure()
+        self._show_plot(plot_widget, plot)
+        plot_widget.refresh()
+
+    def _draw_plot(
+        self, plot_widget: "PlotextPlot", dim1: int, dim2: int, slice_positions: dict | None = None
+    ) -> None:
+        """Draw a 2D slice of the variable over dim1 and dim2 into plot_widget."""
+        max_rows, max_cols = _plot_resolution(plot_widget)
+        plot = self._plot_data(dim1, dim2, slice_positions or {}, max_rows, max_cols)
+        self._show_plot(plot_widget, plot)
 
-        z = sliced_var.values
-        z = np.nan_to_num(z, nan=0.0)
+    # pylint: disable=too-many-locals
+    def _plot_data(
+        self, dim1: int, dim2: int, slice_positions: dict, max_rows: int, max_cols: int
+    ) -> tuple:
+        """Return the matrix, ticks, axis labels and title of a 2D slice.
 
-        # Get coordinate values
-        if x_dim_name in sliced_var.coords:
-            x_coords = sliced_var.coords[x_dim_name].values
-        else:
-            x_coords = np.arange(z.shape[1])
+        Only reads the variable and the caches, so it is safe to call from a
+        worker thread.
+        """
+        slice_dict = self._get_slice_dict(dim1, dim2, slice_positions)
 
-        if y_dim_name in sliced_var.coords:
-            y_coords = sliced_var.coords[y_dim_name].values
-        else:
-            y_coords = np.arange(z.shape[0])
+        # Slice the variable to get 2D data, with dim1 along the rows
+        z = loaded = self._load_slice(slice_dict)
+        if dim1 > dim2:
+            z = z.T
 
-        plot_widget = PlotextPlot(id="plot-widget")
-        plot_widget.plt.matrix_plot(z.tolist())
-        plot_widget.plt.xticks(
-            np.arange(len(x_coords)),
-            labels=[format_coord_value(val) for val in x_coords],
-        )
-        plot_widget.plt.yticks(
-            np.arange(len(y_coords)),
-            labels=[format_coord_value(val) for val in y_coords],
-        )
+        (y_coords, y_label), (x_coords, x_label) = self._axis_coords(dim1, dim2)
 
-        unit = sliced_var.coords[y_dim_name].attrs.get("units", "")
-        label = f"{y_dim_name} ({unit})" if unit else y_dim_name
-        plot_widget.plt.xlabel(label)
+        z, x_coords, y_coords = _downsample_2d(z, x_coords, y_coords, max_rows, max_cols)
+        z = _fill_downsampled(z, loaded)
 
-        unit = sliced_var.coords[x_dim_name].attrs.get("units", "")
-        label = f"{x_dim_name} ({unit})" if unit else x_dim_name
-        plot_widget.plt.ylabel(label)
+        ticks = self._axis_ticks((dim1, dim2, max_rows, max_cols), x_coords, y_coords)
 
         # Add info about sliced dimensions to title
         slice_info = ", ".join([f"{dim}={idx}" for dim, idx in slice_dict.items()])
         title = (
-            f"{self.variable.name} ({slice_info})"
+            f"{self._name} ({slice_info})"
             if slice_info
-            else f"{self.variable.name}"
+            else f"{self._name}"
         )
+        return _to_grayscale(z), ticks, (y_label, x_label), title
+
+    @staticmethod
+    def _show_plot(plot_widget: "PlotextPlot", plot: tuple) -> None:
+        """Draw plot data returned by _plot_data into plot_widget."""
+        matrix, (x_ticks, x_labels, y_ticks, y_labels), (xlabel, ylabel), title = plot
+        plot_widget.plt.matrix_plot(matrix)
+        plot_widget.plt.xticks(x_ticks, labels=x_labels)
+        plot_widget.plt.yticks(y_ticks, labels=y_labels)
+        plot_widget.plt.xlabel(xlabel)
+        plot_widget.plt.ylabel(ylabel)
         plot_widget.plt.title(title)
-        return plot_widget
 
 
 MAX_TABLE_ROWS = 500
@@ -311,6 +675,11 @@ class TableNDWidget(Widget):
     def __init__(self, variable: xr.DataArray, **kwargs) -> None:
         super().__init__(**kwargs)
         self.variable = variable
+        # The row and column radio sets, kept from compose for ND variables
+        self._dim1_group: RadioSet | None = None
+        self._dim2_group: RadioSet | None = None
+        self._populate_timer: Timer | None = None
+        self._sliders: dict[str, Slider] = {}
 
     def compose(self) -> ComposeResult:
         """Create child widgets."""
@@ -335,6 +704,7 @@ class TableNDWidget(Widget):
             r1.border_title = "[white]Row Dimension[/]"
             r2 = RadioSet(*r2_buttons, id="col-dim-select")
             r2.border_title = "[white]Column Dimension[/]"
+            self._dim1_group, self._dim2_group = r1, r2
 
             contents.append(Horizontal(r1, r2, id="table-dim-controls"))
             contents.append(self._create_slice_sliders(dim1, dim2))
@@ -357,35 +727,44 @@ class TableNDWidget(Widget):
                 s = Slider(0, size - 1, step=1, value=size // 2, id=f"slice-{dim}", name=dim)
                 s.border_title = f"[white]Slice: {dim}[/]"
                 sliders.append(s)
+        self._sliders = {s.name: s for s in sliders}
         return Horizontal(*sliders, id="table-slice-container")
 
     def _get_selected_dim(self, radio_set: RadioSet) -> int:
         """Return the index of the currently selected RadioButton in a RadioSet."""
-        for i, radio in enumerate(radio_set.children):
-            if isinstance(radio, RadioButton) and radio.value:
-                return i
-        return 0
+        index = radio_set.pressed_index
+        if index >= 0:
+            return index
+        # The pressed button is only tracked once the set has mounted
+        return next(
+            (
+                i
+                for i, radio in enumerate(radio_set.children)
+                if isinstance(radio, RadioButton) and radio.value
+            ),
+            0,
+        )
 
     @on(Slider.Changed)
     async def on_slider_changed(self, _event: Slider.Changed) -> None:
-        """Refresh the table when a slice slider moves."""
-        self._populate_table()
+        """Refresh the table once a slice slider has stopped moving."""
+        if self._populate_timer is not None:
+            self._populate_timer.stop()
+        self._populate_timer = self.set_timer(SLIDER_DEBOUNCE_SECONDS, self._populate_table)
 
     async def on_radio_set_changed(self, _message: RadioSet.Changed) -> None:
         """Update disabled states, rebuild sliders, and refresh table on axis change."""
-        dim1_group = self.query_one("#row-dim-select")
-        dim2_group = self.query_one("#col-dim-select")
+        dim1_group, dim2_group = self._dim1_group, self._dim2_group
 
         dim1 = self._get_selected_dim(dim1_group)
         dim2 = self._get_selected_dim(dim2_group)
 
-        for i, radio in enumerate(dim1_group.children):
-            if isinstance(radio, RadioButton):
-                radio.disabled = i == dim2
-
-        for i, radio in enumerate(dim2_group.children):
-            if isinstance(radio, RadioButton):
-                radio.disabled = i == dim1
+        # Each radio set is walked once; a button is disabled when its
+        # dimension is selected in the other set
+        for radios, other in ((list(dim1_group.children), dim2), (list(dim2_group.children), dim1)):
+            for i, radio in enumerate(radios):
+                if isinstance(radio, RadioButton):
+                    radio.disabled = i == other
 
         dim1_group.refresh()
         dim2_group.refresh()
@@ -420,8 +799,8 @@ class TableNDWidget(Widget):
             return
 
         if ndim > 2:
-            dim1 = self._get_selected_dim(self.query_one("#row-dim-select"))
-            dim2 = self._get_selected_dim(self.query_one("#col-dim-select"))
+            dim1 = self._get_selected_dim(self._dim1_group)
+            dim2 = self._get_selected_dim(self._dim2_group)
         else:
             dim1, dim2 = 0, 1
 
@@ -432,7 +811,7 @@ class TableNDWidget(Widget):
         for i, dim in enumerate(dims):
             if i in (dim1, dim2):
                 continue
-            slice_dict[dim] = int(self.query_one(f"#slice-{dim}", Slider).value)
+            slice_dict[dim] = int(self._sliders[dim].value)
 
         sliced = self.variable.isel(slice_dict).transpose(row_dim, col_dim)
         data_2d = sliced.values
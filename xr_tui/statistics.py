@@ -0,0 +1,146 @@
+"""Summary statistics and histograms for the statistics screen"""
+
+import numpy as np
+
+# Chunked variables up to this size are loaded to compute exact statistics;
+# larger ones are streamed chunk by chunk with approximate quartiles.
+STATISTICS_MEMORY_BUDGET = 512 * 1024**2
+APPROXIMATE_STATISTICS = ("Median", "25%", "50%", "75%")
+
+
+def quartiles_and_range(valid: np.ndarray, in_place: bool = False) -> tuple:
+    """Return the quartiles, minimum and maximum of a NaN-free 1D array.
+
+    A single np.partition places the extremes and the values either side of
+    each quartile, instead of separate min, max and percentile passes. The
+    quartiles are linearly interpolated exactly as np.percentile does. With
+    in_place the array is reordered rather than copied.
+    """
+    n = valid.size
+    positions = np.array([0.25, 0.5, 0.75]) * (n - 1)
+    lower = np.floor(positions).astype(np.intp)
+    upper = np.minimum(lower + 1, n - 1)
+    kth = np.unique(np.concatenate(([0, n - 1], lower, upper)))
+    if in_place:
+        valid.partition(kth)
+    else:
+        valid = np.partition(valid, kth)
+
+    below, above = valid[lower], valid[upper]
+    frac = positions - lower
+    quartiles = np.where(
+        frac >= 0.5, above - (above - below) * (1 - frac), below + (above - below) * frac
+    )
+    return quartiles, valid[0], valid[-1]
+
+
+HISTOGRAM_BLOCK_SIZE = 1 << 20
+STD_BLOCK_SIZE = 1 << 16
+
+
+def blockwise_std(valid: np.ndarray, mean) -> float:
+    """Return the population standard deviation of a 1D array given its mean.
+
+    Squared deviations are summed with np.vdot one cache-sized block at a time,
+    so unlike ``valid.std()`` the mean isn't recomputed and no full-size
+    temporary array of deviations is allocated.
+    """
+    dtype = np.result_type(valid.dtype, np.float64)
+    total = 0.0
+    for start in range(0, valid.size, STD_BLOCK_SIZE):
+        deviations = np.subtract(valid[start : start + STD_BLOCK_SIZE], mean, dtype=dtype)
+        total += np.real(np.vdot(deviations, deviations))
+    return np.sqrt(total / valid.size)
+
+
+def uniform_histogram(
+    data: np.ndarray, n_bins: int, value_range: tuple | None = None
+) -> tuple[np.ndarray, np.ndarray]:
+    """Histogram the finite values of a 1D array into uniform bins.
+
+    Equivalent to ``np.histogram(data[np.isfinite(data)], bins=n_bins)``, but
+    bin indices are computed directly and counted with ``np.bincount`` one
+    cache-sized block at a time, so no full-size filtered copy is made.
+    value_range gives the finite (min, max) when it is already known.
+    """
+    if value_range is None:
+        finite = data[np.isfinite(data)]
+        value_range = (finite.min(), finite.max()) if finite.size else (np.nan, np.nan)
+
+    # The range may hold scalars of the data's own integer dtype, whose
+    # difference can wrap around, so the arithmetic is done in Python floats
+    lo, hi = value_range
+    lo, hi = float(lo), float(hi)
+    if not np.isfinite(lo):
+        # No finite values to bin
+        return np.histogram([], bins=n_bins)
+    if lo == hi:
+        # Match np.histogram's handling of a constant array
+        lo, hi = lo - 0.5, hi + 0.5
+
+    # Bin assignment only needs to resolve n_bins intervals, so float64 data is
+    # binned in float32 (half the memory traffic) when the values fit in
+    # float32 and its rounding (eps 2**-23) is far below a bin's width.
+    # The statistics themselves are always computed at native precision.
+    work_dtype = np.result_type(data.dtype, np.float64)
+    magnitude, span = max(abs(lo), abs(hi)), hi - lo
+    fits_float32 = magnitude < 1e38 and magnitude * 2**-23 * n_bins * 100 < span
+    if data.dtype == np.float64 and fits_float32:
+        work_dtype = np.dtype(np.float32)
+
+    counts = np.zeros(n_bins, dtype=np.intp)
+    offset, scale = work_dtype.type(lo), work_dtype.type(n_bins / span)
+    for start in range(0, data.size, HISTOGRAM_BLOCK_SIZE):
+        indices = np.subtract(data[start : start + HISTOGRAM_BLOCK_SIZE], offset, dtype=work_dtype)
+        indices *= scale
+        indices = indices[np.isfinite(indices)].astype(np.intp)
+        # The maximum value lands on the right edge, which belongs to the last bin
+        np.minimum(indices, n_bins - 1, out=indices)
+        counts += np.bincount(indices, minlength=n_bins)
+
+    return counts, np.linspace(lo, hi, n_bins + 1)
+
+
+HISTOGRAM_SAMPLE_SIZE = 1_000_000
+
+
+def sampled_histogram(
+    data: np.ndarray, n_bins: int, value_range: tuple | None = None
+) -> tuple[np.ndarray, np.ndarray]:
+    """Histogram a 1D array, estimating the counts from a sample for large arrays.
+
+    Beyond HISTOGRAM_SAMPLE_SIZE values a fixed-seed uniform random sample
+    gives bar heights indistinguishable at plotting resolution. The counts are
+    scaled back up so the frequencies stay in units of the whole array.
+    """
+    if data.size <= HISTOGRAM_SAMPLE_SIZE:
+        return uniform_histogram(data, n_bins, value_range)
+
+    rng = np.random.default_rng(0)
+    sample = data[rng.integers(0, data.size, size=HISTOGRAM_SAMPLE_SIZE)]
+    counts, edges = uniform_histogram(sample, n_bins, value_range)
+    return np.rint(counts * (data.size / sample.size)).astype(np.intp), edges
+
+
+def summary_statistics(
+    size: int, nan_count: int, inf_count: int, moments: tuple, quartiles: np.ndarray
+) -> dict:
+    """Build the statistics table from precomputed (mean, std, min, max) and quartiles."""
+    mean, std, data_min, data_max = moments
+    pct_25, pct_50, pct_75 = quartiles
+    return {
+        "Mean": mean,
+        "Median": pct_50,
+        "Standard Deviation": std,
+        "Range": data_max - data_min,
+        "Minimum": data_min,
+        "25%": pct_25,
+        "50%": pct_50,
+        "75%": pct_75,
+        "Maximum": data_max,
+        "Count": size - nan_count,
+        "NaN Count": nan_count,
+        "NaN %": (nan_count / size) * 100,
+        "Inf Count": inf_count,
+        "Inf %": (inf_count / size) * 100,
+    }